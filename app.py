@@ -1,15 +1,22 @@
-import uvicorn
-from fastapi import FastAPI, File, UploadFile, HTTPException
-from fastapi.responses import JSONResponse
+import os
+import re
+import tempfile
+import time
+import uuid
+from fastapi import FastAPI, File, UploadFile, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Dict
+from typing import List, Dict, Optional
 from config import db_config
-from azure_openai import LLM_Azure
-from source_key_mapping import ColumnMatchAgent
-from member_data_reconciliation import CSVIntegrityAgent, compare_csv_integrity
-import pandas as pd
-from populate_member_db import get_db_connection, validate_member_id, transform_data
+# pandas, SQLAlchemy and the openai SDK are imported inside the endpoints that use them,
+# so worker startup and lightweight routes such as /health do not pay for loading them
+from reconciliation_report import ReconciliationReport, ReportSummary, ReportPage, CATEGORIES
 
+# Directory where reconciliation reports are written as gzipped NDJSON
+REPORTS_DIR = os.environ.get("RECONCILIATION_REPORTS_DIR", os.path.join(tempfile.gettempdir(), "reconciliation_reports"))
+
+# Reports older than this many seconds are removed when a new report is written
+REPORT_RETENTION_SECONDS = int(os.environ.get("RECONCILIATION_REPORT_RETENTION_SECONDS", 24 * 60 * 60))
 
 # FastAPI initialization
 app = FastAPI()
@@ -33,6 +40,42 @@ class DataTransferResponse(BaseModel):
 class ErrorResponse(BaseModel):
     error: str
 
+class ReconcileResponse(BaseModel):
+    report_id: str
+    summary: ReportSummary
+    normalization_eliminated: Dict[str, int] = Field(..., description="Diffs per column removed by normalization before diffing")
+    page: ReportPage
+
+
+def get_report_path(report_id: str) -> str:
+    """Resolve a report ID to its file, rejecting anything that is not a generated ID"""
+    if not re.fullmatch(r"[0-9a-f]{32}", report_id):
+        raise HTTPException(status_code=400, detail="Invalid report ID")
+    return os.path.join(REPORTS_DIR, f"{report_id}.ndjson.gz")
+
+
+def load_report(report_id: str, summarize: bool = True) -> ReconciliationReport:
+    path = get_report_path(report_id)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"Report '{report_id}' not found")
+    return ReconciliationReport.load(path, summarize=summarize)
+
+
+def cleanup_reports():
+    """Delete reports older than REPORT_RETENTION_SECONDS"""
+    cutoff = time.time() - REPORT_RETENTION_SECONDS
+    for entry in os.scandir(REPORTS_DIR):
+        if entry.name.endswith(".ndjson.gz") and entry.stat().st_mtime < cutoff:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass  # Already removed by another worker
+
+
+def validate_category(category: Optional[str]):
+    if category is not None and category not in CATEGORIES:
+        raise HTTPException(status_code=400, detail=f"Category must be one of {CATEGORIES}")
+
 @app.get("/")
 async def root():
     return {"message": "Hello, World!"}
@@ -45,6 +88,9 @@ async def health_check():
 # Endpoint implementation
 @app.post("/member-merge/map-source-keys-withtestdata", response_model=MapSourceKeysResponse)
 def map_source_keys(request: MapSourceKeysRequest):
+    from azure_openai import LLM_Azure
+    from source_key_mapping import ColumnMatchAgent
+
     try:
         # Extract data from request
         tables = request.tables
@@ -67,11 +113,21 @@ def map_source_keys(request: MapSourceKeysRequest):
         raise HTTPException(status_code=500, detail=str(e))
     
 
-@app.post("/member-merge/reconcile-member-data-test")
+@app.post("/member-merge/reconcile-member-data-test", response_model=ReconcileResponse, response_model_exclude_none=True)
 async def reconcile_member_data_test(
     file1: UploadFile = File(...), 
-    file2: UploadFile = File(...)
+    file2: UploadFile = File(...),
+    limit: int = Query(100, ge=1, le=1000, description="Number of records in the first page")
 ):
+    """
+    Reconcile two member files and store the per-diff results as a report.
+
+    Returns the report ID, summary counts and the first page of records; the rest
+    can be fetched from the report endpoints.
+    """
+    import pandas as pd
+    from member_data_reconciliation import CSVIntegrityAgent, compare_member_data
+
     try:
         # Read the uploaded files into pandas DataFrames
         df1 = pd.read_csv(file1.file)
@@ -80,19 +136,71 @@ async def reconcile_member_data_test(
         # Initialize the agent and process the files
         agent = CSVIntegrityAgent()
 
-        # Get missing and altered rows
-        missing_rows, altered_rows = compare_csv_integrity(file1.filename, file2.filename)
+        # Get missing and altered rows from the normalized data
+        missing_rows, altered_rows, eliminated, compared = compare_member_data(df1, df2)
 
-        # Analyze and get the results
-        analysis_result, _ = agent.analyze_and_update_changes(
-            df1, df2, missing_rows, altered_rows
+        # Analyze and write the results to an on-disk report
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        cleanup_reports()
+        report_id = uuid.uuid4().hex
+        report, _ = agent.analyze_and_update_changes(
+            df1, df2, missing_rows, altered_rows,
+            report_file=get_report_path(report_id),
+            compared=compared
         )
 
-        return JSONResponse(content={"analysis_result": analysis_result}, status_code=200)
+        return ReconcileResponse(
+            report_id=report_id,
+            summary=report.summary,
+            normalization_eliminated=eliminated,
+            page=report.page(limit=limit)
+        )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    
+
+
+@app.get("/member-merge/reports/{report_id}", response_model=ReportPage, response_model_exclude_none=True)
+def get_report_page(
+    report_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    category: Optional[str] = Query(None, description="Filter by category, e.g. TYPO"),
+    column: Optional[str] = Query(None, description="Filter by column, e.g. Zip")
+):
+    """Fetch one page of a reconciliation report, optionally filtered by category and column."""
+    validate_category(category)
+    report = load_report(report_id, summarize=False)
+    return report.page(offset=offset, limit=limit, category=category, column=column)
+
+
+@app.get("/member-merge/reports/{report_id}/summary", response_model=ReportSummary)
+def get_report_summary(report_id: str):
+    return load_report(report_id).summary
+
+
+@app.delete("/member-merge/reports/{report_id}")
+def delete_report(report_id: str):
+    path = get_report_path(report_id)
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail=f"Report '{report_id}' not found")
+    os.remove(path)
+    return {"status": "deleted", "report_id": report_id}
+
+
+@app.get("/member-merge/reports/{report_id}/ndjson")
+def stream_report(
+    report_id: str,
+    category: Optional[str] = Query(None, description="Filter by category, e.g. TYPO"),
+    column: Optional[str] = Query(None, description="Filter by column, e.g. Zip")
+):
+    """Stream a reconciliation report as newline-delimited JSON."""
+    validate_category(category)
+    report = load_report(report_id, summarize=False)
+    return StreamingResponse(
+        report.iter_ndjson(category=category, column=column),
+        media_type="application/x-ndjson"
+    )
 
 
 @app.post(
@@ -111,6 +219,9 @@ async def transfer_data(request: DataTransferRequest):
     - Transforms data according to provided mapping
     - Inserts transformed data into destination table
     """
+    import pandas as pd
+    from populate_member_db import get_db_connection, validate_member_id, transform_data
+
     try:
         # Connect to database
         conn = get_db_connection()
@@ -180,4 +291,5 @@ async def transfer_data(request: DataTransferRequest):
 
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, loop="asyncio", host="0.0.0.0", port=8000)
@@ -1,9 +1,11 @@
-from openai import AzureOpenAI
 from config import api_key, api_base, api_version, deployment_name
 
 class LLM_Azure:
     def __init__(self):
         """Initialize with Azure OpenAI credentials"""
+        # Imported here so that importing this module does not load the openai SDK
+        from openai import AzureOpenAI
+
         self.client = AzureOpenAI(
             api_key=api_key,
             api_version=api_version,
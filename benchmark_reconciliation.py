@@ -0,0 +1,369 @@
+import argparse
+import asyncio
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from multiprocessing import get_context
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from member_data_normalization import STATE_CODES
+
+STANDARD_COLUMNS = ["Member ID", "First Name", "Last Name", "DOB", "Address", "City", "State", "Zip"]
+
+# Source table column names used for the transfer benchmark (standard column -> source column)
+TRANSFER_MAPPING = {
+    "Member ID": "member_id",
+    "First Name": "first_name",
+    "Last Name": "last_name",
+    "DOB": "dob",
+    "Address": "address",
+    "City": "city",
+    "State": "state",
+    "Zip": "zip",
+}
+
+FIRST_NAMES = np.array([
+    "Marcus", "Lisa", "Gabriel", "Beverly", "James", "Maria", "Robert", "Patricia", "Michael", "Jennifer",
+    "William", "Linda", "David", "Elizabeth", "Richard", "Barbara", "Joseph", "Susan", "Thomas", "Jessica",
+])
+LAST_NAMES = np.array([
+    "Strong", "Garcia", "Lee", "Ballard", "Smith", "Johnson", "Williams", "Brown", "Jones", "Miller",
+    "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Taylor", "Moore",
+])
+STREETS = np.array([
+    "Carol Village", "Jose Station", "Lisa Ways", "Daniels Loaf", "Oak Street", "Maple Avenue",
+    "Cedar Lane", "Pine Road", "Elm Court", "Lake Drive", "Hill Crossing", "River Path",
+])
+CITIES = np.array([
+    "Sheltonfurt", "Kennethbury", "Lake Chelseatown", "New Debraberg", "Springfield", "Riverside",
+    "Fairview", "Franklin", "Greenville", "Clinton", "Georgetown", "Salem",
+])
+STATES = np.array([
+    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY",
+    "LA", "ME", "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ", "NM", "NY", "NC", "ND",
+    "OH", "OK", "OR", "PA", "RI", "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY",
+])
+
+# Read ZIPs as text so leading zeros survive and their loss shows up as a diff
+CSV_DTYPES = {"Zip": str}
+
+# Columns eligible for typos and legitimate updates
+TEXT_COLUMNS = ["First Name", "Last Name", "Address", "City"]
+
+
+class OfflineLLM:
+    """
+    Offline stand-in for LLM_Azure that answers with a category after a fixed latency.
+    """
+
+    def __init__(self, latency: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.calls = 0
+        self._rng = np.random.default_rng(seed)
+
+    def get_completion(self, prompt: str) -> str:
+        """Return a canned analysis ending in a category line"""
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        category = self._rng.choice(["TYPO", "UPDATE", "CONCERNING"])
+        return f"Offline analysis.\nCATEGORY: {category}"
+
+
+@dataclass
+class GeneratorConfig:
+    rows: int = 10_000
+    seed: int = 42
+    missing_rate: float = 0.01
+    typo_rate: float = 0.02
+    update_rate: float = 0.01
+    zip_loss_rate: float = 0.05
+    format_noise_rate: float = 0.0
+
+
+def _apply_typo(value: str, rng: np.random.Generator) -> str:
+    """Swap two adjacent characters, dropping one instead if they are equal; append 'x' to values shorter than two characters"""
+    if len(value) < 2:
+        return value + "x"
+    pos = int(rng.integers(0, len(value) - 1))
+    if value[pos] == value[pos + 1]:
+        return value[:pos] + value[pos + 1:]
+    return value[:pos] + value[pos + 1] + value[pos] + value[pos + 2:]
+
+
+def generate_member_data(config: GeneratorConfig) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """
+    Generate a seeded pair of member files with controlled discrepancies.
+
+    Args:
+        config: Row count, seed and per-row rates for each kind of discrepancy
+
+    Returns:
+        tuple: (original DataFrame, modified DataFrame, count of injected discrepancies by kind)
+    """
+    rng = np.random.default_rng(config.seed)
+    n = config.rows
+
+    dob = np.datetime64("1940-01-01") + rng.integers(0, 65 * 365, n).astype("timedelta64[D]")
+    df1 = pd.DataFrame({
+        "Member ID": 100000000000 + np.arange(n, dtype=np.int64),
+        "First Name": rng.choice(FIRST_NAMES, n),
+        "Last Name": rng.choice(LAST_NAMES, n),
+        "DOB": pd.Series(dob).dt.strftime("%Y-%m-%d"),
+        "Address": pd.Series(rng.integers(100, 99999, n)).astype(str) + " " + rng.choice(STREETS, n),
+        "City": rng.choice(CITIES, n),
+        "State": rng.choice(STATES, n),
+        "Zip": pd.Series(rng.integers(0, 100000, n)).astype(str).str.zfill(5),
+    })
+    df2 = df1.copy()
+    injected = {"missing": 0, "typo": 0, "update": 0, "zip_leading_zero_loss": 0, "format_noise": 0}
+
+    # Typos: a character swap in one text column per selected row
+    typo_idx = np.flatnonzero(rng.random(n) < config.typo_rate)
+    typo_cols = rng.choice(TEXT_COLUMNS, len(typo_idx))
+    for idx, col in zip(typo_idx, typo_cols):
+        df2.at[idx, col] = _apply_typo(df2.at[idx, col], rng)
+    injected["typo"] = len(typo_idx)
+
+    # Legitimate updates: a new address
+    update_idx = np.flatnonzero(rng.random(n) < config.update_rate)
+    new_addresses = pd.Series(rng.integers(100, 99999, len(update_idx))).astype(str) + " " + rng.choice(STREETS, len(update_idx))
+    df2.loc[update_idx, "Address"] = new_addresses.values
+    injected["update"] = len(update_idx)
+
+    # ZIP leading-zero loss, as produced by integer coercion upstream
+    zip_loss = (rng.random(n) < config.zip_loss_rate) & df2["Zip"].str.startswith("0").values
+    df2.loc[zip_loss, "Zip"] = df2.loc[zip_loss, "Zip"].str.lstrip("0").replace("", "0")
+    injected["zip_leading_zero_loss"] = int(zip_loss.sum())
+
+    # Representation noise: casing, padding, US-style dates and full state names
+    noise_idx = np.flatnonzero(rng.random(n) < config.format_noise_rate)
+    noise_kind = rng.integers(0, 4, len(noise_idx))
+    state_names = {code: name.title() for name, code in STATE_CODES.items()}
+    for kind, column in enumerate(["First Name", "Last Name", "DOB", "State"]):
+        idx = noise_idx[noise_kind == kind]
+        values = df2.loc[idx, column]
+        if column == "First Name":
+            df2.loc[idx, column] = values.str.lower()
+        elif column == "Last Name":
+            df2.loc[idx, column] = " " + values.str.upper() + " "
+        elif column == "DOB":
+            df2.loc[idx, column] = pd.to_datetime(values).dt.strftime("%m/%d/%Y")
+        else:
+            df2.loc[idx, column] = values.map(state_names)
+    injected["format_noise"] = len(noise_idx)
+
+    # Missing rows: dropped from the second file
+    missing = rng.random(n) < config.missing_rate
+    df2 = df2[~missing].reset_index(drop=True)
+    injected["missing"] = int(missing.sum())
+
+    return df1, df2, injected
+
+
+def get_peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class BenchmarkResult:
+    stage: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    peak_rss_mb: float
+    llm_calls: int
+    details: Dict
+
+
+def _result(stage: str, rows: int, start: float, llm_calls: int = 0, details: Optional[Dict] = None) -> BenchmarkResult:
+    elapsed = time.perf_counter() - start
+    return BenchmarkResult(
+        stage=stage,
+        rows=rows,
+        seconds=round(elapsed, 4),
+        rows_per_sec=round(rows / elapsed, 1) if elapsed > 0 else float("inf"),
+        peak_rss_mb=round(get_peak_rss_mb(), 1),
+        llm_calls=llm_calls,
+        details=details or {},
+    )
+
+
+def bench_compare(file1: str, file2: str, rows: int, normalize: bool) -> Tuple[BenchmarkResult, List[int], List[Tuple[int, List[str]]]]:
+    from member_data_reconciliation import compare_member_data
+
+    start = time.perf_counter()
+    df1 = pd.read_csv(file1, dtype=CSV_DTYPES)
+    df2 = pd.read_csv(file2, dtype=CSV_DTYPES)
+    missing_rows, altered_rows, eliminated, _ = compare_member_data(df1, df2, normalize)
+    result = _result("compare", rows, start, details={
+        "missing_rows": len(missing_rows),
+        "altered_rows": len(altered_rows),
+        "normalization_eliminated": sum(eliminated.values()),
+    })
+    return result, missing_rows, altered_rows
+
+
+def bench_analyze(file1: str, file2: str, report_file: str, rows: int, missing_rows, altered_rows,
+                  llm_latency: float, seed: int, normalize: bool) -> BenchmarkResult:
+    from member_data_reconciliation import CSVIntegrityAgent
+    from member_data_normalization import normalize_member_data
+
+    df1 = pd.read_csv(file1, dtype=CSV_DTYPES)
+    df2 = pd.read_csv(file2, dtype=CSV_DTYPES)
+    # The frames compare_member_data diffed; rebuilt here rather than shipped between processes
+    compared = (normalize_member_data(df1), normalize_member_data(df2)) if normalize else None
+    llm = OfflineLLM(latency=llm_latency, seed=seed)
+    agent = CSVIntegrityAgent(llm)
+
+    start = time.perf_counter()
+    report, _ = agent.analyze_and_update_changes(df1, df2, missing_rows, altered_rows,
+                                                 report_file=report_file, compared=compared)
+    return _result("analyze", rows, start, llm_calls=llm.calls, details={
+        "report_records": report.summary.total,
+        "report_bytes": os.path.getsize(report_file),
+    })
+
+
+def bench_transfer(file2: str, rows: int, db_url: str) -> BenchmarkResult:
+    from sqlalchemy import create_engine, text
+    import app
+    import populate_member_db
+
+    engine = create_engine(db_url)
+    source_table = "bench_member_source"
+    destination_table = "bench_member_destination"
+
+    # Seed the source table with source-style column names (not timed)
+    source_df = pd.read_csv(file2, dtype=str).rename(columns=TRANSFER_MAPPING)
+    source_df.to_sql(source_table, engine, if_exists="replace", index=False)
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {destination_table}"))
+
+    # Point the endpoint at the benchmark database instead of the configured Postgres host
+    populate_member_db.get_db_connection = lambda: engine
+    request = app.DataTransferRequest(
+        source_table=source_table,
+        destination_table=destination_table,
+        mapping=TRANSFER_MAPPING,
+    )
+
+    start = time.perf_counter()
+    response = asyncio.run(app.transfer_data(request))
+    result = _result("transfer", response.rows_transferred, start)
+    engine.dispose()
+    return result
+
+
+def bench_generate(config: GeneratorConfig, file1: str, file2: str) -> BenchmarkResult:
+    start = time.perf_counter()
+    df1, df2, injected = generate_member_data(config)
+    df1.to_csv(file1, index=False)
+    df2.to_csv(file2, index=False)
+    return _result("generate", config.rows, start, details=injected)
+
+
+def run_isolated(func, *args):
+    """Run func in a fresh process, so the peak RSS it reports covers only that call"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(func, *args).result()
+
+
+def run_benchmark(config: GeneratorConfig, stages: List[str], llm_latency: float, db_url: Optional[str],
+                  normalize: bool = True) -> List[BenchmarkResult]:
+    """
+    Generate one dataset and run the requested stages against it, each stage in its own process.
+
+    Args:
+        config: Generator settings for this run
+        stages: Any of "compare", "analyze", "transfer"
+        llm_latency: Seconds the offline LLM sleeps per call
+        db_url: SQLAlchemy URL for the transfer stage; a temporary SQLite file when None
+        normalize: Normalize the standard columns before diffing
+
+    Returns:
+        List[BenchmarkResult]: One result per stage, in run order
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file1 = os.path.join(tmp_dir, "members_original.csv")
+        file2 = os.path.join(tmp_dir, "members_modified.csv")
+
+        results.append(run_isolated(bench_generate, config, file1, file2))
+
+        missing_rows, altered_rows = [], []
+        if "compare" in stages or "analyze" in stages:
+            result, missing_rows, altered_rows = run_isolated(bench_compare, file1, file2, config.rows, normalize)
+            if "compare" in stages:
+                results.append(result)
+
+        if "analyze" in stages:
+            report_file = os.path.join(tmp_dir, "report.ndjson.gz")
+            results.append(run_isolated(bench_analyze, file1, file2, report_file, config.rows,
+                                        missing_rows, altered_rows, llm_latency, config.seed, normalize))
+
+        if "transfer" in stages:
+            url = db_url or f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+            results.append(run_isolated(bench_transfer, file2, config.rows, url))
+
+    return results
+
+
+def print_results(results: List[BenchmarkResult]):
+    header = f"{'stage':<10}{'rows':>12}{'seconds':>12}{'rows/sec':>14}{'peak RSS MB':>14}{'LLM calls':>12}  details"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(f"{r.stage:<10}{r.rows:>12}{r.seconds:>12.3f}{r.rows_per_sec:>14.1f}{r.peak_rss_mb:>14.1f}{r.llm_calls:>12}  {r.details}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark member data reconciliation on synthetic data")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000], help="Row counts to benchmark, e.g. 10000 100000 1000000")
+    parser.add_argument("--stages", nargs="+", default=["compare", "analyze", "transfer"], choices=["compare", "analyze", "transfer"])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--missing-rate", type=float, default=0.01)
+    parser.add_argument("--typo-rate", type=float, default=0.02)
+    parser.add_argument("--update-rate", type=float, default=0.01)
+    parser.add_argument("--zip-loss-rate", type=float, default=0.05)
+    parser.add_argument("--format-noise-rate", type=float, default=0.0, help="Rate of casing, padding, date-format and state-name noise")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Seconds per offline LLM call")
+    parser.add_argument("--db-url", default=None, help="SQLAlchemy URL for the transfer stage, e.g. a local Postgres; defaults to temporary SQLite")
+    parser.add_argument("--no-normalize", action="store_true", help="Diff the raw data without the normalization stage")
+    parser.add_argument("--json", dest="json_output", default=None, help="Also write results as JSON to this path")
+    args = parser.parse_args()
+
+    all_results = []
+    for rows in args.rows:
+        config = GeneratorConfig(
+            rows=rows,
+            seed=args.seed,
+            missing_rate=args.missing_rate,
+            typo_rate=args.typo_rate,
+            update_rate=args.update_rate,
+            zip_loss_rate=args.zip_loss_rate,
+            format_noise_rate=args.format_noise_rate,
+        )
+        results = run_benchmark(config, args.stages, args.llm_latency, args.db_url, not args.no_normalize)
+        print(f"\n=== {rows} rows ===")
+        print_results(results)
+        all_results.extend(results)
+
+    if args.json_output:
+        with open(args.json_output, "w") as f:
+            json.dump([asdict(r) for r in all_results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Entry points to measure: module -> (import-time budget in ms, modules that must stay unloaded after import)
+TARGETS = {
+    "app": (600.0, ["pandas", "numpy", "sqlalchemy", "openai", "uvicorn"]),
+    "member_data_reconciliation": (1500.0, ["openai", "sqlalchemy"]),
+}
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def measure_import(module: str, deferred: List[str]) -> Tuple[float, List[Tuple[str, float]], List[str]]:
+    """
+    Import a module in a fresh interpreter under `python -X importtime`.
+
+    Args:
+        module: Module to import
+        deferred: Modules that should not be loaded as a side effect of the import
+
+    Returns:
+        tuple: (cumulative import time in ms, slowest top-level dependencies as (name, ms), deferred modules that were loaded)
+    """
+    code = (
+        f"import sys, json; import {module}; "
+        f"print(json.dumps([m for m in {deferred!r} if m in sys.modules]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True
+    )
+
+    total_ms = 0.0
+    dependencies = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, indent, name = int(match.group(2)), len(match.group(3)), match.group(4)
+        # Children are reported before their parent, so direct dependencies collected
+        # since the last top-level line belong to the next top-level import
+        if indent == 1:
+            if name == module:
+                total_ms = cumulative_us / 1000
+                break
+            dependencies = []
+        elif indent == 3:
+            dependencies.append((name, cumulative_us / 1000))
+
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    return total_ms, sorted(dependencies, key=lambda d: d[1], reverse=True), loaded
+
+
+def run(targets: Dict[str, Tuple[float, List[str]]], repeat: int, top: int) -> bool:
+    """Measure each target and print a report; returns False if any budget or deferral check fails"""
+    ok = True
+    for module, (budget_ms, deferred) in targets.items():
+        # Warm-up run so bytecode compilation is not counted
+        measure_import(module, deferred)
+        runs = [measure_import(module, deferred) for _ in range(repeat)]
+        median_ms = statistics.median(r[0] for r in runs)
+        _, dependencies, loaded = runs[-1]
+
+        within_budget = median_ms <= budget_ms
+        ok = ok and within_budget and not loaded
+
+        print(f"\n=== import {module} ===")
+        print(f"median: {median_ms:.1f} ms over {repeat} runs (budget {budget_ms:.0f} ms) {'OK' if within_budget else 'OVER BUDGET'}")
+        print(f"deferred modules loaded at import: {loaded or 'none'}")
+        print("slowest dependencies:")
+        for name, ms in dependencies[:top]:
+            print(f"  {name:<40}{ms:>10.1f} ms")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold import time of the API and CLI entry points")
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest dependencies to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Override the import-time budget for every target")
+    args = parser.parse_args()
+
+    targets = {}
+    for module in args.targets:
+        budget_ms, deferred = TARGETS[module]
+        targets[module] = (args.budget_ms if args.budget_ms is not None else budget_ms, deferred)
+
+    if not run(targets, args.repeat, args.top):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
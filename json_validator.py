@@ -1,10 +1,14 @@
 import json
 import re
-from functools import wraps
+from functools import wraps, lru_cache
 from prompts import get_clean_json_prompt
 from azure_openai import LLM_Azure
 
-llm = LLM_Azure()
+
+@lru_cache(maxsize=None)
+def get_llm() -> LLM_Azure:
+    """Return the shared LLM client used for JSON cleanup, creating it on first use"""
+    return LLM_Azure()
 
 
 def is_json(response_text):
@@ -44,7 +48,7 @@ def validate_json(max_attempts=3):
                 if final_data is not None:
                     return final_data
                 else:
-                    content = llm.get_completion(get_clean_json_prompt(content))
+                    content = get_llm().get_completion(get_clean_json_prompt(content))
                     final_data = convert_json(content)
                     if final_data is not None:
                         return final_data
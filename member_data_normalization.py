@@ -0,0 +1,126 @@
+from typing import Callable, Dict
+
+import pandas as pd
+
+STATE_CODES = {
+    "ALABAMA": "AL", "ALASKA": "AK", "ARIZONA": "AZ", "ARKANSAS": "AR", "CALIFORNIA": "CA",
+    "COLORADO": "CO", "CONNECTICUT": "CT", "DELAWARE": "DE", "DISTRICT OF COLUMBIA": "DC", "FLORIDA": "FL",
+    "GEORGIA": "GA", "HAWAII": "HI", "IDAHO": "ID", "ILLINOIS": "IL", "INDIANA": "IN",
+    "IOWA": "IA", "KANSAS": "KS", "KENTUCKY": "KY", "LOUISIANA": "LA", "MAINE": "ME",
+    "MARYLAND": "MD", "MASSACHUSETTS": "MA", "MICHIGAN": "MI", "MINNESOTA": "MN", "MISSISSIPPI": "MS",
+    "MISSOURI": "MO", "MONTANA": "MT", "NEBRASKA": "NE", "NEVADA": "NV", "NEW HAMPSHIRE": "NH",
+    "NEW JERSEY": "NJ", "NEW MEXICO": "NM", "NEW YORK": "NY", "NORTH CAROLINA": "NC", "NORTH DAKOTA": "ND",
+    "OHIO": "OH", "OKLAHOMA": "OK", "OREGON": "OR", "PENNSYLVANIA": "PA", "RHODE ISLAND": "RI",
+    "SOUTH CAROLINA": "SC", "SOUTH DAKOTA": "SD", "TENNESSEE": "TN", "TEXAS": "TX", "UTAH": "UT",
+    "VERMONT": "VT", "VIRGINIA": "VA", "WASHINGTON": "WA", "WEST VIRGINIA": "WV", "WISCONSIN": "WI",
+    "WYOMING": "WY", "PUERTO RICO": "PR", "GUAM": "GU", "VIRGIN ISLANDS": "VI", "AMERICAN SAMOA": "AS",
+}
+
+
+def _clean_text(series: pd.Series) -> pd.Series:
+    """Uppercase, trim and collapse internal whitespace"""
+    return series.astype("string").str.strip().str.replace(r"\s+", " ", regex=True).str.upper()
+
+
+def normalize_member_id(series: pd.Series) -> pd.Series:
+    """Render IDs as trimmed strings, so int, float-read and text IDs for the same member match"""
+    ids = series.astype("string").str.strip().str.replace(r"\.0$", "", regex=True)
+    # Plain object strings compare much faster than the nullable string dtype in per-member lookups
+    return ids.astype(object).where(ids.notna(), None)
+
+
+def normalize_name(series: pd.Series) -> pd.Series:
+    return _clean_text(series)
+
+
+def normalize_address(series: pd.Series) -> pd.Series:
+    """Clean text and drop periods and commas, e.g. 'Apt. 4,' -> 'APT 4'"""
+    return _clean_text(series).str.replace(r"[.,]", "", regex=True).str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def normalize_dob(series: pd.Series) -> pd.Series:
+    """Render parseable dates as YYYY-MM-DD, leaving unparseable values as cleaned text"""
+    text = series.astype("string").str.strip()
+    parsed = pd.to_datetime(text, format="mixed", errors="coerce")
+    return parsed.dt.strftime("%Y-%m-%d").astype("string").fillna(text)
+
+
+def normalize_state(series: pd.Series) -> pd.Series:
+    """Map full state names to their two-letter codes"""
+    text = _clean_text(series)
+    return text.map(STATE_CODES).fillna(text).astype("string")
+
+
+def normalize_zip(series: pd.Series) -> pd.Series:
+    """Restore leading zeros lost to integer coercion and reduce ZIP+4 to the 5-digit ZIP"""
+    text = series.astype("string").str.strip().str.replace(r"\.0$", "", regex=True)
+    # An unhyphenated +4 suffix is only recognised on a full 9-digit value, so e.g. '560066' is left as is
+    digits = text.str.extract(r"^(?:(\d{5})\d{4}|(\d{1,5})(?:-\d{4})?)$")
+    return digits[0].fillna(digits[1]).str.zfill(5).fillna(text)
+
+
+# Normalizers keyed by the standard member columns used in map_source_keys
+COLUMN_NORMALIZERS: Dict[str, Callable[[pd.Series], pd.Series]] = {
+    "Member ID": normalize_member_id,
+    "First Name": normalize_name,
+    "Last Name": normalize_name,
+    "DOB": normalize_dob,
+    "Address": normalize_address,
+    "City": normalize_name,
+    "State": normalize_state,
+    "Zip": normalize_zip,
+}
+
+
+def normalize_member_data(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize the standard member columns of a DataFrame, one whole column at a time.
+
+    Args:
+        df: Member data with standard column names; other columns are left as is
+
+    Returns:
+        pd.DataFrame: A normalized copy with the same columns and row order
+    """
+    normalized = df.copy()
+    for column, normalizer in COLUMN_NORMALIZERS.items():
+        if column in normalized.columns:
+            normalized[column] = normalizer(normalized[column])
+    return normalized
+
+
+def _differs(a: pd.Series, b: pd.Series) -> pd.Series:
+    """Elementwise inequality where a missing value differs from anything but another missing value"""
+    a, b = a.reset_index(drop=True), b.reset_index(drop=True)
+    return (a != b).fillna(True).astype(bool) & ~(a.isna() & b.isna())
+
+
+def count_eliminated_diffs(raw1: pd.DataFrame, raw2: pd.DataFrame,
+                           norm1: pd.DataFrame, norm2: pd.DataFrame) -> Dict[str, int]:
+    """
+    Count, per column, the cells that differ between two member files but match after normalization.
+
+    Args:
+        raw1, raw2: Member data as read
+        norm1, norm2: The same data after normalize_member_data
+
+    Returns:
+        Dict[str, int]: Eliminated diffs for each normalized column, over members present in both files
+    """
+    def keyed(raw: pd.DataFrame, norm: pd.DataFrame):
+        ids = pd.Index(norm["Member ID"])
+        first = ~ids.duplicated()
+        return raw.set_axis(ids)[first], norm.set_axis(ids)[first]
+
+    raw1, norm1 = keyed(raw1, norm1)
+    raw2, norm2 = keyed(raw2, norm2)
+    common = raw1.index.intersection(raw2.index)
+
+    eliminated = {}
+    for column in COLUMN_NORMALIZERS:
+        if column == "Member ID" or column not in raw1.columns or column not in raw2.columns:
+            continue
+        raw_diff = _differs(raw1.loc[common, column], raw2.loc[common, column])
+        norm_diff = _differs(norm1.loc[common, column], norm2.loc[common, column])
+        eliminated[column] = int((raw_diff & ~norm_diff).sum())
+    return eliminated
@@ -1,59 +1,124 @@
 import hashlib
 import pandas as pd
 from difflib import SequenceMatcher
-from typing import List, Tuple
-from openai import AzureOpenAI
+from typing import Dict, List, Tuple
 from prompts import row_difference_analysis_prompt
 from azure_openai import LLM_Azure
+from member_data_normalization import normalize_member_data, count_eliminated_diffs
+from reconciliation_report import (
+    ReconciliationReport, DiffRecord,
+    ACTION_ADDED, ACTION_FLAGGED, ACTION_UPDATED,
+)
 
 def generate_md5_hash(row):
     row_data = ','.join(str(val) for val in row)
     return hashlib.md5(row_data.encode()).hexdigest()
 
-def generate_hashes_from_csv(file_path):
-    df = pd.read_csv(file_path)
+def generate_hashes(df):
     hash_dict = {}
     for idx, row in df.iterrows():
         row_hash = generate_md5_hash(row)
         hash_dict[row_hash] = row['Member ID']
-    return hash_dict, df
+    return hash_dict
+
+def generate_hashes_from_csv(file_path):
+    df = pd.read_csv(file_path)
+    return generate_hashes(df), df
+
+def compare_member_data(df1: pd.DataFrame, df2: pd.DataFrame,
+                        normalize: bool = True) -> Tuple[List, List[Tuple], Dict[str, int], Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Find missing and altered rows between two member DataFrames.
+
+    Args:
+        df1: Original member data
+        df2: Member data to check against the original
+        normalize: Normalize the standard columns before hashing, so representation
+            differences (casing, date formats, ZIP leading zeros, ...) are not reported
+
+    Returns:
+        tuple: (missing member IDs, (member ID, altered columns) pairs, per-column counts of diffs
+            eliminated by normalization, the (df1, df2) frames that were compared). Member IDs refer
+            to the compared frames, which should be passed on to analyze_and_update_changes.
+    """
+    eliminated = {}
+    if normalize:
+        norm1 = normalize_member_data(df1)
+        norm2 = normalize_member_data(df2)
+        eliminated = count_eliminated_diffs(df1, df2, norm1, norm2)
+        df1, df2 = norm1, norm2
 
-def compare_csv_integrity(file1, file2):
-    file1_hash_dict, df1 = generate_hashes_from_csv(file1)
-    file2_hash_dict, df2 = generate_hashes_from_csv(file2)
+    file1_hash_dict = generate_hashes(df1)
+    file2_hash_dict = generate_hashes(df2)
 
     missing_rows = []
     altered_rows = []
+    rows1 = member_row_positions(df1)
+    rows2 = member_row_positions(df2)
 
     for row_hash, member_id in file1_hash_dict.items():
         if row_hash not in file2_hash_dict:
-            if member_id not in df2['Member ID'].values:
+            if pd.isna(member_id) or member_id not in rows2:
                 missing_rows.append(member_id)
             else:
-                row1 = df1[df1['Member ID'] == member_id].iloc[0]
-                row2 = df2[df2['Member ID'] == member_id].iloc[0]
+                row1 = df1.iloc[rows1[member_id][0]]
+                row2 = df2.iloc[rows2[member_id][0]]
                 altered_columns = []
                 for col in df1.columns:
-                    if row1[col] != row2[col]:
+                    value1, value2 = row1[col], row2[col]
+                    missing1, missing2 = pd.isna(value1), pd.isna(value2)
+                    if missing1 != missing2 or (not missing1 and value1 != value2):
                         altered_columns.append(col)
                 if altered_columns:
                     altered_rows.append((member_id, altered_columns))
 
+    return missing_rows, altered_rows, eliminated, (df1, df2)
+
+def compare_csv_integrity(file1, file2, normalize: bool = True):
+    df1 = pd.read_csv(file1)
+    df2 = pd.read_csv(file2)
+    missing_rows, altered_rows, _, _ = compare_member_data(df1, df2, normalize)
     return missing_rows, altered_rows
 
+def to_report_value(value):
+    """Convert a DataFrame cell to the string stored in a report record"""
+    if value is None or pd.isna(value):
+        return None
+    return str(value)
+
+def to_report_id(member_id):
+    """Convert a Member ID cell to the value stored in a report record, None when blank"""
+    if pd.isna(member_id):
+        return None
+    return member_id.item() if hasattr(member_id, 'item') else member_id
+
+def member_row_positions(df: pd.DataFrame) -> dict:
+    """Map each non-blank Member ID to the positions of its rows, in file order"""
+    return df.groupby('Member ID', sort=False).indices
+
 def calculate_string_similarity(str1: str, str2: str) -> float:
     """Calculate similarity ratio between two strings"""
     return SequenceMatcher(None, str(str1), str(str2)).ratio()
 
 class CSVIntegrityAgent:
-    def __init__(self,):
-        """Initialize with Azure OpenAI credentials"""
-        self.llm = LLM_Azure()
+    def __init__(self, llm: LLM_Azure = None):
+        """Initialize with Azure OpenAI credentials, or with a provided LLM instance"""
+        self.llm = llm if llm is not None else LLM_Azure()
         
-    def analyze_modification(self, df1: pd.DataFrame, df2: pd.DataFrame, member_id: int, column: str) -> dict:
-        """Analyze the specific modification for a given member ID and column"""
-        original_value = df1[df1['Member ID'] == member_id][column].iloc[0]
-        modified_value = df2[df2['Member ID'] == member_id][column].iloc[0]
+    def analyze_modification(self, df1: pd.DataFrame, df2: pd.DataFrame, member_id: int, column: str,
+                             rows1: dict = None, rows2: dict = None) -> dict:
+        """
+        Analyze the specific modification for a given member ID and column.
+
+        rows1 and rows2 optionally map each Member ID to its row positions in df1 and df2,
+        as built by member_row_positions, to avoid scanning the ID column for every diff.
+        """
+        if rows1 is not None and rows2 is not None:
+            original_value = df1[column].iloc[rows1[member_id][0]]
+            modified_value = df2[column].iloc[rows2[member_id][0]]
+        else:
+            original_value = df1[df1['Member ID'] == member_id][column].iloc[0]
+            modified_value = df2[df2['Member ID'] == member_id][column].iloc[0]
         
         similarity = calculate_string_similarity(original_value, modified_value)
         
@@ -111,56 +176,89 @@ class CSVIntegrityAgent:
     def analyze_and_update_changes(self, df1: pd.DataFrame, df2: pd.DataFrame, 
                                  missing_rows: List[int], 
                                  altered_rows: List[Tuple[int, List[str]]], 
-                                 output_file: str = None) -> tuple[str, pd.DataFrame]:
-        """Analyze changes and update df2 based on analysis results"""
-        analysis_results = []
+                                 output_file: str = None,
+                                 report_file: str = None,
+                                 compared: Tuple[pd.DataFrame, pd.DataFrame] = None) -> tuple[ReconciliationReport, pd.DataFrame]:
+        """
+        Analyze changes, update df2 based on analysis results and record each diff in a report.
+
+        compared holds the frames the diffs were found on, as returned by compare_member_data.
+        Member IDs are looked up and values for the LLM are taken from them; rows written to
+        the updated DataFrame and IDs written to the report come from df1 as is. Defaults to (df1, df2).
+        """
+        compared1, compared2 = compared if compared is not None else (df1, df2)
+
+        rows1 = member_row_positions(compared1)
+        rows2 = member_row_positions(compared2)
+
+        def report_id(member_id):
+            # The ID as it appears in df1, from the first row for duplicated IDs
+            return to_report_id(df1['Member ID'].iloc[rows1[member_id][0]])
+
         df2_updated = df2.copy()
-        updates_made = []
-        
-        # Analyze missing rows
-        if missing_rows:
-            analysis_results.append(f"\nMissing Records Analysis:")
-            analysis_results.append(f"Found {len(missing_rows)} missing records: {missing_rows}")
-            # Add missing rows from df1 to df2
-            for member_id in missing_rows:
-                missing_row = df1[df1['Member ID'] == member_id]
-                if not missing_row.empty:
-                    df2_updated = pd.concat([df2_updated, missing_row], ignore_index=True)
-                    updates_made.append(f"Added missing record for Member ID: {member_id}")
-        
-        # Analyze modified rows
-        if altered_rows:
-            analysis_results.append(f"\nModified Records Analysis:")
+        missing_df = None
+        report = ReconciliationReport(report_file, output_file=output_file)
+
+        with report:
+            # Collect missing rows from df1; they are appended to df2 after the updates below
+            if missing_rows:
+                ids1 = compared1['Member ID']
+                known_missing = [m for m in missing_rows if not pd.isna(m)]
+                is_missing = ids1.isin(known_missing).to_numpy(dtype=bool)
+                if len(known_missing) < len(missing_rows):
+                    is_missing = is_missing | ids1.isna().to_numpy(dtype=bool)
+                missing_df = df1[is_missing]
+                added = set(ids1[is_missing].dropna())
+                for member_id in missing_rows:
+                    # Rows with a blank Member ID are recorded without an ID rather than failing the run
+                    if pd.isna(member_id):
+                        record_id, was_added = None, True
+                    else:
+                        record_id, was_added = report_id(member_id), member_id in added
+                    report.add(DiffRecord(
+                        member_id=record_id,
+                        category="MISSING",
+                        action=ACTION_ADDED if was_added else ACTION_FLAGGED,
+                    ))
+
+            # Analyze modified rows
             for member_id, columns in altered_rows:
                 for column in columns:
-                    mod_details = self.analyze_modification(df1, df2, member_id, column)
+                    mod_details = self.analyze_modification(compared1, compared2, member_id, column, rows1, rows2)
                     prompt = row_difference_analysis_prompt(mod_details)
                     analysis = self.llm.get_completion(prompt)
                     category = self.get_modification_category(analysis)
-                    
-                    analysis_results.append(f"\nMember ID: {member_id} - {column}")
-                    analysis_results.append(f"Original: {mod_details['original_value']}")
-                    analysis_results.append(f"Modified: {mod_details['modified_value']}")
-                    analysis_results.append(f"Similarity Score: {mod_details['similarity_score']:.2f}")
-                    analysis_results.append(f"Analysis: {analysis}")
-                    analysis_results.append(f"Category: {category}")
-                    
+
                     # Update df2 if the change is a typo or legitimate update
                     if category in ["TYPO", "UPDATE"]:
-                        df2_updated.loc[df2_updated['Member ID'] == member_id, column] = \
-                            df1.loc[df1['Member ID'] == member_id, column].iloc[0]
-                        updates_made.append(f"Updated {column} for Member ID: {member_id} (Category: {category})")
-        
-        if updates_made:
-            analysis_results.append("\nUpdates Made:")
-            analysis_results.extend(updates_made)
-        
+                        # Files read with different dtypes (e.g. text vs integer ZIPs) share an object column
+                        if df2_updated[column].dtype != df1[column].dtype and df2_updated[column].dtype != object:
+                            df2_updated[column] = df2_updated[column].astype(object)
+                        df2_updated.iloc[rows2[member_id], df2_updated.columns.get_loc(column)] = \
+                            df1[column].iloc[rows1[member_id][0]]
+                        action = ACTION_UPDATED
+                    else:
+                        action = ACTION_FLAGGED
+
+                    report.add(DiffRecord(
+                        member_id=report_id(member_id),
+                        column=column,
+                        original_value=to_report_value(mod_details['original_value']),
+                        modified_value=to_report_value(mod_details['modified_value']),
+                        similarity_score=mod_details['similarity_score'],
+                        category=category,
+                        action=action,
+                        analysis=analysis,
+                    ))
+
+        if missing_df is not None:
+            df2_updated = pd.concat([df2_updated, missing_df], ignore_index=True)
+
         # Save updated DataFrame if output_file is provided
         if output_file:
             df2_updated.to_csv(output_file, index=False)
-            analysis_results.append(f"\nUpdated data saved to: {output_file}")
-        
-        return "\n".join(analysis_results), df2_updated
+
+        return report, df2_updated
 
 
 def main():
@@ -171,14 +269,18 @@ def main():
     df2 = pd.read_csv("dataIntegrityTest2.csv")
 
     # Get the comparison results
-    missing_rows, altered_rows = compare_csv_integrity("dataIntegrityTest1.csv", "dataIntegrityTest2.csv")
+    missing_rows, altered_rows, eliminated, compared = compare_member_data(df1, df2)
+    print(f"Diffs eliminated by normalization: {sum(eliminated.values())} {eliminated}")
 
     # Analyze the changes and get updated DataFrame
-    analysis_result, updated_df = agent.analyze_and_update_changes(
+    report, updated_df = agent.analyze_and_update_changes(
         df1, df2, missing_rows, altered_rows, 
-        output_file="mergedFile.csv"
+        output_file="mergedFile.csv",
+        report_file="reconciliationReport.ndjson.gz",
+        compared=compared
     )
-    print(analysis_result)
+    for line in report.iter_text():
+        print(line)
 
 if __name__=="__main__":
     main()
\ No newline at end of file
@@ -3,15 +3,9 @@ import pandas as pd
 from typing import Dict
 from sqlalchemy import create_engine
 from config import db_config
-from fastapi import FastAPI, File, HTTPException
+from fastapi import HTTPException
 
 
-app = FastAPI(
-    title="Data Transfer API",
-    description="API for transferring data between tables with column mapping",
-    version="1.0.0"
-)
-
 def get_db_connection():
     """Create and return a database connection."""
     try:
@@ -0,0 +1,194 @@
+import gzip
+import json
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Union
+
+from pydantic import BaseModel
+
+# Categories assigned by the LLM, plus MISSING for rows absent from the second file
+CATEGORIES = ["TYPO", "UPDATE", "CONCERNING", "MISSING"]
+
+# Actions taken on the reconciled DataFrame
+ACTION_UPDATED = "UPDATED"
+ACTION_ADDED = "ADDED"
+ACTION_FLAGGED = "FLAGGED"
+
+
+class DiffRecord(BaseModel):
+    member_id: Optional[Union[int, str]] = None
+    column: Optional[str] = None
+    original_value: Optional[str] = None
+    modified_value: Optional[str] = None
+    similarity_score: Optional[float] = None
+    category: str
+    action: str
+    analysis: Optional[str] = None
+
+
+class ReportSummary(BaseModel):
+    total: int
+    by_category: Dict[str, int]
+    by_column: Dict[str, int]
+    output_file: Optional[str] = None
+
+
+class ReportPage(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    records: List[DiffRecord]
+
+
+class ReconciliationReport:
+    """
+    Per-diff reconciliation results, kept in memory or streamed to a gzipped NDJSON file.
+    """
+
+    def __init__(self, path: Optional[str] = None, output_file: Optional[str] = None):
+        """
+        Args:
+            path: File to write records to as they are added; records stay in memory when None
+            output_file: Where the reconciled data was saved, if anywhere
+        """
+        self.path = path
+        self.output_file = output_file
+        self._records: List[DiffRecord] = []
+        self._by_category: Counter = Counter()
+        self._by_column: Counter = Counter()
+        self._file = gzip.open(path, "wt", encoding="utf-8") if path else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @classmethod
+    def load(cls, path: str, summarize: bool = True) -> "ReconciliationReport":
+        """Open a report previously written to disk, scanning it for summary counts unless summarize is False"""
+        report = cls()
+        report.path = path
+        if summarize:
+            for record in report.iter_records():
+                report._count(record)
+        return report
+
+    def _count(self, record: DiffRecord):
+        self._by_category[record.category] += 1
+        if record.column:
+            self._by_column[record.column] += 1
+
+    def add(self, record: DiffRecord):
+        """Append a record to the report"""
+        self._count(record)
+        if self._file:
+            self._file.write(record.model_dump_json(exclude_none=True))
+            self._file.write("\n")
+        else:
+            self._records.append(record)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @property
+    def summary(self) -> ReportSummary:
+        return ReportSummary(
+            total=sum(self._by_category.values()),
+            by_category=dict(self._by_category),
+            by_column=dict(self._by_column),
+            output_file=self.output_file,
+        )
+
+    def iter_records(self, category: Optional[str] = None, column: Optional[str] = None) -> Iterator[DiffRecord]:
+        """
+        Iterate over records, optionally filtered by category and/or column.
+
+        Args:
+            category: Only yield records with this category
+            column: Only yield records for this column
+
+        Returns:
+            Iterator[DiffRecord]: Matching records in the order they were added
+        """
+        if self.path:
+            records = (DiffRecord.model_validate_json(line) for line in self._iter_lines())
+            yield from self._filter(records, category, column)
+        else:
+            yield from self._filter(self._records, category, column)
+
+    def _iter_lines(self) -> Iterator[str]:
+        """Yield the raw NDJSON lines of an on-disk report"""
+        self.close()
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            yield from f
+
+    @staticmethod
+    def _filter(records, category: Optional[str], column: Optional[str]) -> Iterator[DiffRecord]:
+        for record in records:
+            if category and record.category != category:
+                continue
+            if column and record.column != column:
+                continue
+            yield record
+
+    def page(self, offset: int = 0, limit: int = 100,
+             category: Optional[str] = None, column: Optional[str] = None) -> ReportPage:
+        """Return one page of matching records along with the total number of matches"""
+        if not self.path:
+            matches = list(self.iter_records(category, column))
+            return ReportPage(total=len(matches), offset=offset, limit=limit, records=matches[offset:offset + limit])
+
+        # Only records inside the window are validated; filters are checked on the plain JSON
+        records = []
+        total = 0
+        for line in self._iter_lines():
+            if category or column:
+                data = json.loads(line)
+                if category and data.get("category") != category:
+                    continue
+                if column and data.get("column") != column:
+                    continue
+            if offset <= total < offset + limit:
+                records.append(DiffRecord.model_validate_json(line))
+            total += 1
+        return ReportPage(total=total, offset=offset, limit=limit, records=records)
+
+    def iter_ndjson(self, category: Optional[str] = None, column: Optional[str] = None) -> Iterator[str]:
+        """Yield matching records as newline-delimited JSON"""
+        for record in self.iter_records(category, column):
+            yield record.model_dump_json(exclude_none=True) + "\n"
+
+    def iter_text(self) -> Iterator[str]:
+        """Yield the report as human-readable lines"""
+        missing = [r.member_id for r in self.iter_records(category="MISSING")]
+        if missing:
+            yield "\nMissing Records Analysis:"
+            yield f"Found {len(missing)} missing records: [{', '.join(str(m) for m in missing)}]"
+
+        header_written = False
+        updates_made = []
+        for record in self.iter_records():
+            if record.action == ACTION_ADDED:
+                updates_made.append(f"Added missing record for Member ID: {record.member_id}")
+            if record.category == "MISSING":
+                continue
+            if not header_written:
+                yield "\nModified Records Analysis:"
+                header_written = True
+            yield f"\nMember ID: {record.member_id} - {record.column}"
+            yield f"Original: {record.original_value}"
+            yield f"Modified: {record.modified_value}"
+            yield f"Similarity Score: {record.similarity_score:.2f}"
+            yield f"Analysis: {record.analysis}"
+            yield f"Category: {record.category}"
+            if record.action == ACTION_UPDATED:
+                updates_made.append(f"Updated {record.column} for Member ID: {record.member_id} (Category: {record.category})")
+
+        if updates_made:
+            yield "\nUpdates Made:"
+            yield from updates_made
+
+        if self.output_file:
+            yield f"\nUpdated data saved to: {self.output_file}"
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+from member_data_normalization import (
+    _differs, count_eliminated_diffs, normalize_dob, normalize_member_data,
+    normalize_member_id, normalize_state, normalize_zip,
+)
+from member_data_reconciliation import compare_csv_integrity, compare_member_data
+
+
+def test_normalize_zip():
+    zips = pd.Series(["6371", "06371", " 501.0", "02134-5678", "2134-5678", "123456789", "560066", "AB1", None], dtype=object)
+    assert normalize_zip(zips).tolist() == ["06371", "06371", "00501", "02134", "02134", "12345", "560066", "AB1", pd.NA]
+    assert normalize_zip(pd.Series([6371, 12345])).tolist() == ["06371", "12345"]
+
+
+def test_normalize_dob_mixed_formats():
+    dobs = pd.Series(["1983-12-24", "12/24/1983", " 1983-12-24 ", "not a date", None])
+    assert normalize_dob(dobs).tolist() == ["1983-12-24", "1983-12-24", "1983-12-24", "not a date", pd.NA]
+
+
+def test_normalize_state_names_and_codes():
+    states = pd.Series(["Georgia", "ga", " GA ", "new  york", "XX"])
+    assert normalize_state(states).tolist() == ["GA", "GA", "GA", "NY", "XX"]
+
+
+def test_normalize_member_id_canonical_strings():
+    assert normalize_member_id(pd.Series([1, 2])).tolist() == ["1", "2"]
+    assert normalize_member_id(pd.Series([1.0, np.nan])).tolist() == ["1", None]
+    assert normalize_member_id(pd.Series([" 1", "M3 "])).tolist() == ["1", "M3"]
+    # Python ints in an object column, as built from DB or JSON records
+    assert normalize_member_id(pd.Series([1, "2", None], dtype=object)).tolist() == ["1", "2", None]
+
+
+def test_normalize_member_data_leaves_other_columns():
+    df = pd.DataFrame({"First Name": [" ann  marie "], "Plan": [" Gold "]})
+    normalized = normalize_member_data(df)
+    assert normalized["First Name"].tolist() == ["ANN MARIE"]
+    assert normalized["Plan"].tolist() == [" Gold "]
+    assert df["First Name"].tolist() == [" ann  marie "]
+
+
+def test_differs_missing_values():
+    a = pd.Series(["x", None, None, "y"], dtype="string")
+    b = pd.Series(["x", None, "z", None], dtype="string")
+    assert _differs(a, b).tolist() == [False, False, True, True]
+
+
+def test_count_eliminated_diffs():
+    raw1 = pd.DataFrame({"Member ID": [1, 2, 3], "First Name": ["Ann", "Bo", "Cy"],
+                         "State": ["GA", "TX", "NY"], "Zip": ["02134", "12345", "00501"]})
+    raw2 = pd.DataFrame({"Member ID": ["1", "2"], "First Name": ["ann", "Bob"],
+                         "State": ["Georgia", "TX"], "Zip": ["2134", "12345"]})
+    eliminated = count_eliminated_diffs(raw1, raw2, normalize_member_data(raw1), normalize_member_data(raw2))
+    assert eliminated == {"First Name": 1, "State": 1, "Zip": 1}
+
+
+def test_compare_member_data_matches_ids_across_types():
+    df1 = pd.DataFrame({"Member ID": [1, 2, 3], "First Name": ["Ann", "Bo", "Cy"],
+                        "Last Name": ["Lee", None, "Ng"], "Zip": ["02134", "12345", "00501"]})
+    df2 = pd.DataFrame({"Member ID": ["1", " 2", "M3"], "First Name": ["ANN", "Bob", "Cy"],
+                        "Last Name": ["Lee", None, "Ng"], "Zip": ["2134-5678", "12345", "00501"]})
+    missing_rows, altered_rows, eliminated, (compared1, compared2) = compare_member_data(df1, df2)
+
+    assert missing_rows == ["3"]
+    # Last Name is missing on both sides, so it is not an altered column
+    assert altered_rows == [("2", ["First Name"])]
+    assert eliminated == {"First Name": 1, "Last Name": 0, "Zip": 1}
+    assert compared2["Member ID"].tolist() == ["1", "2", "M3"]
+
+
+def test_compare_member_data_without_normalization():
+    df1 = pd.DataFrame({"Member ID": [1, 2], "First Name": ["Ann", "Bo"], "Last Name": [None, "X"]})
+    df2 = pd.DataFrame({"Member ID": [1, 2], "First Name": ["ANN", "Bo"], "Last Name": [None, "Y"]})
+    missing_rows, altered_rows, eliminated, _ = compare_member_data(df1, df2, normalize=False)
+    assert missing_rows == []
+    assert altered_rows == [(1, ["First Name"]), (2, ["Last Name"])]
+    assert eliminated == {}
+
+
+def test_bundled_csv_pair():
+    expected_missing = ["100000000005", "100000000009"]
+    expected_altered = [("100000000010", ["First Name"]), ("100000000011", ["DOB"]), ("100000000013", ["Zip"])]
+    assert compare_csv_integrity("dataIntegrityTest1.csv", "dataIntegrityTest2.csv") == (expected_missing, expected_altered)
+
+    # Reading one side as text keeps ZIP leading zeros; IDs and ZIPs still line up with the integer-read side
+    df1 = pd.read_csv("dataIntegrityTest1.csv", dtype=str)
+    df2 = pd.read_csv("dataIntegrityTest2.csv")
+    missing_rows, altered_rows, eliminated, _ = compare_member_data(df1, df2)
+    assert (missing_rows, altered_rows) == (expected_missing, expected_altered)
+    assert eliminated["Zip"] > 0
@@ -0,0 +1,195 @@
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+import app
+import member_data_reconciliation
+from member_data_reconciliation import CSVIntegrityAgent, compare_member_data
+from reconciliation_report import DiffRecord, ReconciliationReport
+
+# Category the stub LLM answers with for each column
+STUB_CATEGORIES = {"First Name": "TYPO", "DOB": "UPDATE"}
+
+
+class StubLLM:
+    def get_completion(self, prompt: str) -> str:
+        column = next(line.split(":", 1)[1].strip() for line in prompt.splitlines() if line.strip().startswith("Column:"))
+        return f"Stub analysis.\nCATEGORY: {STUB_CATEGORIES.get(column, 'CONCERNING')}"
+
+
+def make_records():
+    return [
+        DiffRecord(member_id=1, category="MISSING", action="ADDED"),
+        DiffRecord(member_id=2, column="Zip", original_value="06371", modified_value="560066",
+                   similarity_score=0.2, category="CONCERNING", action="FLAGGED", analysis="a"),
+        DiffRecord(member_id="M3", column="First Name", original_value="Brian", modified_value="Bran",
+                   similarity_score=0.89, category="TYPO", action="UPDATED", analysis="b"),
+        DiffRecord(member_id=4, column="Zip", original_value="02134", modified_value="02135",
+                   similarity_score=0.8, category="TYPO", action="UPDATED", analysis="c"),
+    ]
+
+
+@pytest.fixture(params=["memory", "disk"])
+def report(request, tmp_path):
+    path = str(tmp_path / "report.ndjson.gz") if request.param == "disk" else None
+    with ReconciliationReport(path) as report:
+        for record in make_records():
+            report.add(record)
+    return report
+
+
+def test_page_offset_window(report):
+    page = report.page(offset=1, limit=2)
+    assert page.total == 4
+    assert [r.member_id for r in page.records] == [2, "M3"]
+    assert report.page(offset=10, limit=2).records == []
+
+
+def test_page_filters(report):
+    page = report.page(column="Zip")
+    assert page.total == 2
+    assert [r.member_id for r in page.records] == [2, 4]
+
+    page = report.page(offset=1, category="TYPO")
+    assert page.total == 2
+    assert [r.member_id for r in page.records] == [4]
+
+    assert report.page(category="TYPO", column="Zip").total == 1
+
+
+def test_summary(report):
+    summary = report.summary
+    assert summary.total == 4
+    assert summary.by_category == {"MISSING": 1, "CONCERNING": 1, "TYPO": 2}
+    assert summary.by_column == {"Zip": 2, "First Name": 1}
+
+
+def test_load_from_disk(tmp_path):
+    path = str(tmp_path / "report.ndjson.gz")
+    with ReconciliationReport(path) as report:
+        for record in make_records():
+            report.add(record)
+
+    unsummarized = ReconciliationReport.load(path, summarize=False)
+    assert unsummarized.summary.total == 0
+    assert unsummarized.page(category="MISSING").records == make_records()[:1]
+    assert list(unsummarized.iter_records()) == make_records()
+
+    assert ReconciliationReport.load(path).summary == report.summary
+
+
+def test_iter_text_matches_legacy_format():
+    df1 = pd.read_csv("dataIntegrityTest1.csv")
+    df2 = pd.read_csv("dataIntegrityTest2.csv")
+    missing_rows, altered_rows, _, compared = compare_member_data(df1, df2, normalize=False)
+    report, updated = CSVIntegrityAgent(StubLLM()).analyze_and_update_changes(
+        df1, df2, missing_rows, altered_rows, compared=compared
+    )
+
+    expected = "\n".join([
+        "\nMissing Records Analysis:",
+        "Found 2 missing records: [100000000005, 100000000009]",
+        "\nModified Records Analysis:",
+        "\nMember ID: 100000000010 - First Name",
+        "Original: Brian",
+        "Modified: Bran",
+        "Similarity Score: 0.89",
+        "Analysis: Stub analysis.\nCATEGORY: TYPO",
+        "Category: TYPO",
+        "\nMember ID: 100000000011 - DOB",
+        "Original: 1974-10-05",
+        "Modified: 1975-10-05",
+        "Similarity Score: 0.90",
+        "Analysis: Stub analysis.\nCATEGORY: UPDATE",
+        "Category: UPDATE",
+        "\nMember ID: 100000000013 - Zip",
+        "Original: 6371",
+        "Modified: 560066",
+        "Similarity Score: 0.20",
+        "Analysis: Stub analysis.\nCATEGORY: CONCERNING",
+        "Category: CONCERNING",
+        "\nUpdates Made:",
+        "Added missing record for Member ID: 100000000005",
+        "Added missing record for Member ID: 100000000009",
+        "Updated First Name for Member ID: 100000000010 (Category: TYPO)",
+        "Updated DOB for Member ID: 100000000011 (Category: UPDATE)",
+    ])
+    assert "\n".join(report.iter_text()) == expected
+    assert len(updated) == len(df1)
+
+
+def test_blank_member_id_is_recorded_without_id():
+    df1 = pd.DataFrame({"Member ID": [1, np.nan, 3], "First Name": ["Ann", "Bo", "Cy"]})
+    df2 = pd.DataFrame({"Member ID": [1, 3], "First Name": ["Ann", "Cy"]})
+    missing_rows, altered_rows, _, compared = compare_member_data(df1, df2)
+    report, updated = CSVIntegrityAgent(StubLLM()).analyze_and_update_changes(
+        df1, df2, missing_rows, altered_rows, compared=compared
+    )
+
+    assert [r.model_dump(exclude_none=True) for r in report.iter_records()] == [
+        {"category": "MISSING", "action": "ADDED"}
+    ]
+    assert len(updated) == 3
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(app, "REPORTS_DIR", str(tmp_path))
+    monkeypatch.setattr(member_data_reconciliation, "LLM_Azure", StubLLM)
+    return TestClient(app.app)
+
+
+def reconcile(client, limit=2):
+    with open("dataIntegrityTest1.csv", "rb") as f1, open("dataIntegrityTest2.csv", "rb") as f2:
+        response = client.post(
+            f"/member-merge/reconcile-member-data-test?limit={limit}",
+            files={"file1": ("file1.csv", f1), "file2": ("file2.csv", f2)},
+        )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_reconcile_endpoint_returns_summary_and_first_page(client):
+    body = reconcile(client)
+    assert body["summary"]["total"] == 5
+    assert body["summary"]["by_category"] == {"MISSING": 2, "TYPO": 1, "UPDATE": 1, "CONCERNING": 1}
+    assert body["page"]["total"] == 5
+    assert body["page"]["records"] == [
+        {"member_id": 100000000005, "category": "MISSING", "action": "ADDED"},
+        {"member_id": 100000000009, "category": "MISSING", "action": "ADDED"},
+    ]
+    assert set(body["normalization_eliminated"]) == {"First Name", "Last Name", "DOB", "Address", "City", "State", "Zip"}
+
+
+def test_report_endpoints(client):
+    report_id = reconcile(client)["report_id"]
+
+    page = client.get(f"/member-merge/reports/{report_id}?offset=1&limit=1&category=MISSING").json()
+    assert page["total"] == 2
+    assert [r["member_id"] for r in page["records"]] == [100000000009]
+
+    page = client.get(f"/member-merge/reports/{report_id}?column=DOB").json()
+    assert [(r["member_id"], r["category"], r["action"]) for r in page["records"]] == [(100000000011, "UPDATE", "UPDATED")]
+
+    summary = client.get(f"/member-merge/reports/{report_id}/summary").json()
+    assert summary["by_column"] == {"First Name": 1, "DOB": 1, "Zip": 1}
+
+    stream = client.get(f"/member-merge/reports/{report_id}/ndjson?category=MISSING")
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    assert stream.text.splitlines() == [
+        '{"member_id":100000000005,"category":"MISSING","action":"ADDED"}',
+        '{"member_id":100000000009,"category":"MISSING","action":"ADDED"}',
+    ]
+
+    assert client.delete(f"/member-merge/reports/{report_id}").json() == {"status": "deleted", "report_id": report_id}
+    assert client.get(f"/member-merge/reports/{report_id}").status_code == 404
+    assert client.delete(f"/member-merge/reports/{report_id}").status_code == 404
+
+
+def test_report_endpoint_errors(client):
+    report_id = reconcile(client)["report_id"]
+    assert client.get(f"/member-merge/reports/{report_id}?category=UNKNOWN").status_code == 400
+    assert client.get("/member-merge/reports/not-a-report-id").status_code == 400
+    assert client.get(f"/member-merge/reports/{'0' * 32}").status_code == 404
+    assert client.get(f"/member-merge/reports/{'0' * 32}/ndjson").status_code == 404